@@ -34,6 +34,9 @@ from telegram_payment_bot.utils.wrapped_list import WrappedList
 
 # Authorized users list class
 class AuthorizedUsersList(WrappedList):
+
+    __slots__ = ()
+
     # Constructor
     def __init__(self,
                  config: ConfigObject) -> None:
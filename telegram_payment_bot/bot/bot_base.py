@@ -69,7 +69,8 @@ class BotBase:
             self.config.GetValue(BotConfigTypes.SESSION_NAME),
             api_id=self.config.GetValue(BotConfigTypes.API_ID),
             api_hash=self.config.GetValue(BotConfigTypes.API_HASH),
-            bot_token=self.config.GetValue(BotConfigTypes.BOT_TOKEN)
+            bot_token=self.config.GetValue(BotConfigTypes.BOT_TOKEN),
+            workers=self.config.GetValue(BotConfigTypes.WORKERS)
         )
         # Initialize helper classes
         self.cmd_dispatcher = CommandDispatcher(self.config, self.logger, self.translator)
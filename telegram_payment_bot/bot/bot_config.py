@@ -23,6 +23,8 @@
 #
 import logging
 
+import pyrogram
+
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
 from telegram_payment_bot.config.config_typing import ConfigSectionsType
@@ -110,6 +112,13 @@ BotConfig: ConfigSectionsType = {
             "type": BotConfigTypes.SESSION_NAME,
             "name": "session_name",
         },
+        {
+            "type": BotConfigTypes.WORKERS,
+            "name": "workers",
+            "conv_fct": Utils.StrToInt,
+            "def_val": pyrogram.Client.WORKERS,
+            "valid_if": lambda cfg, val: val > 0,
+        },
     ],
     # App
     "app": [
@@ -237,6 +246,13 @@ BotConfig: ConfigSectionsType = {
             "name": "payment_date_format",
             "def_val": "%d/%m/%Y",
         },
+        {
+            "type": BotConfigTypes.PAYMENT_CACHE_TTL_SEC,
+            "name": "payment_cache_ttl_sec",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
     ],
     # Email
     "email": [
@@ -37,6 +37,7 @@ class BotConfigTypes(ConfigTypes):
     API_HASH = auto()
     BOT_TOKEN = auto()
     SESSION_NAME = auto()
+    WORKERS = auto()
     # App
     APP_TEST_MODE = auto()
     APP_LANG_FILE = auto()
@@ -61,6 +62,7 @@ class BotConfigTypes(ConfigTypes):
     PAYMENT_USER_COL = auto()
     PAYMENT_EXPIRATION_COL = auto()
     PAYMENT_DATE_FORMAT = auto()
+    PAYMENT_CACHE_TTL_SEC = auto()
     # Email
     EMAIL_ENABLED = auto()
     EMAIL_FROM = auto()
@@ -22,7 +22,7 @@
 # Imports
 #
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, ClassVar, List
 
 import pyrogram
 from pyrogram.errors import RPCError
@@ -41,11 +41,44 @@ from telegram_payment_bot.translator.translation_loader import TranslationLoader
 # Classes
 #
 
+# Constants for command message buffer class
+class CommandMessageBufferConst:
+    # Separator between buffered messages
+    MSG_SEPARATOR: str = "\n\n"
+
+
+# Command message buffer class
+# Messages are collected and sent at once, to reduce the number of requests
+class CommandMessageBuffer:
+
+    send_fct: Callable[[str], None]
+    msgs: List[str]
+
+    # Constructor
+    def __init__(self,
+                 send_fct: Callable[[str], None]) -> None:
+        self.send_fct = send_fct
+        self.msgs = []
+
+    # Add message
+    def Add(self,
+            msg: str) -> None:
+        self.msgs.append(msg)
+
+    # Flush messages
+    def Flush(self) -> None:
+        if len(self.msgs) > 0:
+            self.send_fct(CommandMessageBufferConst.MSG_SEPARATOR.join(self.msgs))
+            self.msgs.clear()
+
+
 #
 # Generic command base class
 #
 class CommandBase(ABC):
 
+    # True if the command can only be executed in groups
+    GROUP_CHAT_ONLY: ClassVar[bool] = False
     client: pyrogram.Client
     config: ConfigObject
     logger: Logger
@@ -94,7 +127,11 @@ class CommandBase(ABC):
 
         # Try to execute command
         try:
-            self._ExecuteCommand(**kwargs)
+            # Check if private chat for group-only commands
+            if self.GROUP_CHAT_ONLY and self._IsPrivateChat():
+                self._SendMessage(self.translator.GetSentence("GROUP_ONLY_ERR_MSG"))
+            else:
+                self._ExecuteCommand(**kwargs)
         except RPCError:
             self._SendMessage(self.translator.GetSentence("GENERIC_ERR_MSG"))
             self.logger.GetLogger().exception(
@@ -148,12 +185,17 @@ class CommandBase(ABC):
     def _IsQuietMode(self) -> bool:
         return self.cmd_data.Params().IsLast("q") or self.cmd_data.Params().IsLast("quiet")
 
+    # Create new message buffer
+    def _NewMessageBuffer(self) -> CommandMessageBuffer:
+        return CommandMessageBuffer(self._SendMessage)
+
     # Generate new invite link
-    def _NewInviteLink(self) -> None:
-        # Generate new invite link
-        invite_link = self.client.export_chat_invite_link(self.cmd_data.Chat().id)
-        # Send messages
-        self._SendMessage(self.translator.GetSentence("INVITE_LINK_ALL_CMD"))
+    def _NewInviteLink(self) -> str:
+        return self.client.export_chat_invite_link(self.cmd_data.Chat().id)    # type: ignore
+
+    # Send invite link to authorized users
+    def _SendInviteLinkToAuthUsers(self,
+                                   invite_link: str) -> None:
         self._SendMessageToAuthUsers(
             self.translator.GetSentence("INVITE_LINK_AUTH_CMD",
                                         chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()),
@@ -40,6 +40,9 @@ class CommandParameterError(Exception):
 
 # Command parameters list class
 class CommandParametersList(WrappedList):
+
+    __slots__ = ()
+
     # Get parameter as bool
     def GetAsBool(self,
                   idx: int,
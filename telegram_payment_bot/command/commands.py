@@ -21,13 +21,16 @@
 #
 # Imports
 #
-from typing import Any, Callable
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 from telegram_payment_bot._version import __version__
 from telegram_payment_bot.auth_user.authorized_users_list import AuthorizedUsersList
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.command.command_base import CommandBase
 from telegram_payment_bot.command.command_data import CommandParameterError
+from telegram_payment_bot.config.config_object import ConfigObject
 from telegram_payment_bot.email.smtp_emailer import SmtpEmailerError
 from telegram_payment_bot.member.members_kicker import MembersKicker
 from telegram_payment_bot.member.members_payment_getter import MembersPaymentGetter
@@ -41,29 +44,71 @@ from telegram_payment_bot.payment.payments_check_scheduler import (
 from telegram_payment_bot.payment.payments_data import PaymentErrorTypes
 from telegram_payment_bot.payment.payments_emailer import PaymentsEmailer
 from telegram_payment_bot.payment.payments_loader_factory import PaymentsLoaderFactory
+from telegram_payment_bot.translator.translation_loader import TranslationLoader
 
 
 #
-# Decorators
+# Classes
 #
 
-# Decorator for group-only commands
-def GroupChatOnly(exec_cmd_fct: Callable[..., None]) -> Callable[..., None]:
-    def decorated(self,
-                  **kwargs: Any):
-        # Check if private chat
-        if self._IsPrivateChat():
-            self._SendMessage(self.translator.GetSentence("GROUP_ONLY_ERR_MSG"))
-        else:
-            exec_cmd_fct(self, **kwargs)
-
-    return decorated
+# Utility functions for commands
+class _CommandsUtils:
+    # Contact information sentences, indexed by (support email is set, support Telegram is set)
+    CHECK_NO_USERNAME_CONTACT_SENTENCES: Dict[Tuple[bool, bool], str] = {
+        (True, True): "CHECK_NO_USERNAME_EMAIL_TG_CMD",
+        (True, False): "CHECK_NO_USERNAME_ONLY_EMAIL_CMD",
+        (False, True): "CHECK_NO_USERNAME_ONLY_TG_CMD",
+    }
+    CHECK_NO_PAYMENT_CONTACT_SENTENCES: Dict[Tuple[bool, bool], str] = {
+        (True, True): "CHECK_NO_PAYMENT_EMAIL_TG_CMD",
+        (True, False): "CHECK_NO_PAYMENT_ONLY_EMAIL_CMD",
+        (False, True): "CHECK_NO_PAYMENT_ONLY_TG_CMD",
+    }
+    # Days left sentences: the sentence index is the number of thresholds that are less or equal to the days left
+    DAYS_LEFT_THRESHOLDS: List[int] = [1, 2]
+    DAYS_LEFT_SENTENCES: List[str] = ["TODAY_MSG", "TOMORROW_MSG", "IN_DAYS_MSG"]
+    # Hours left sentences: the sentence index is the number of thresholds that are less or equal to the hours left
+    HOURS_LEFT_THRESHOLDS: List[int] = [2, 48]
+    HOURS_LEFT_SENTENCES: List[str] = ["ASAP_MSG", "WITHIN_HOURS_MSG", "WITHIN_DAYS_MSG"]
+    # Payment error sentences, indexed by error type
+    PAYMENT_ERR_SENTENCES: Dict[PaymentErrorTypes, str] = {
+        PaymentErrorTypes.DUPLICATED_DATA_ERR: "CHECK_PAYMENTS_DATA_DUPLICATED_ERR_CMD",
+        PaymentErrorTypes.INVALID_DATE_ERR: "CHECK_PAYMENTS_DATA_DATE_ERR_CMD",
+    }
+
+    # Get contact information (empty if no contact is set)
+    @staticmethod
+    def GetContactInfo(config: ConfigObject,
+                       translator: TranslationLoader,
+                       sentence_ids: Dict[Tuple[bool, bool], str]) -> str:
+        support_email = config.GetValue(BotConfigTypes.SUPPORT_EMAIL)
+        support_tg = config.GetValue(BotConfigTypes.SUPPORT_TELEGRAM)
+
+        sentence_id = sentence_ids.get((support_email != "", support_tg != ""))
+        if sentence_id is None:
+            return ""
+        return translator.GetSentence(sentence_id,
+                                      support_email=support_email,
+                                      support_telegram=support_tg)
+
+    # Convert days left to string
+    @staticmethod
+    def DaysLeftToStr(translator: TranslationLoader,
+                      days: int) -> str:
+        sentence_idx = bisect.bisect_right(_CommandsUtils.DAYS_LEFT_THRESHOLDS, days)
+        return translator.GetSentence(_CommandsUtils.DAYS_LEFT_SENTENCES[sentence_idx],
+                                      days=days)
+
+    # Convert hours left to string
+    @staticmethod
+    def HoursLeftToStr(translator: TranslationLoader,
+                       hours: int) -> str:
+        sentence_idx = bisect.bisect_right(_CommandsUtils.HOURS_LEFT_THRESHOLDS, hours)
+        return translator.GetSentence(_CommandsUtils.HOURS_LEFT_SENTENCES[sentence_idx],
+                                      hours=hours,
+                                      days=hours // 24)
 
 
-#
-# Classes
-#
-
 #
 # Command for getting help
 #
@@ -140,15 +185,18 @@ class AuthUsersCmd(CommandBase):
 # Command for getting chat information
 #
 class ChatInfoCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
+        chat = self.cmd_data.Chat()
         self._SendMessage(
             self.translator.GetSentence("CHAT_INFO_CMD",
-                                        chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()),
-                                        chat_type=self.cmd_data.Chat().type,
-                                        chat_id=self.cmd_data.Chat().id)
+                                        chat_title=ChatHelper.GetTitle(chat),
+                                        chat_type=chat.type,
+                                        chat_id=chat.id)
         )
 
 
@@ -156,16 +204,19 @@ class ChatInfoCmd(CommandBase):
 # Command for getting the users list
 #
 class UsersListCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
+        chat = self.cmd_data.Chat()
         # Get chat members
-        chat_members = ChatMembersGetter(self.client).GetAll(self.cmd_data.Chat())
+        chat_members = ChatMembersGetter(self.client).GetAll(chat)
         # Send message
         self._SendMessage(
             self.translator.GetSentence("USERS_LIST_CMD",
-                                        chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()),
+                                        chat_title=ChatHelper.GetTitle(chat),
                                         members_count=chat_members.Count(),
                                         members_list=str(chat_members))
         )
@@ -175,11 +226,15 @@ class UsersListCmd(CommandBase):
 # Command for generating a new invite link
 #
 class InviteLinkCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
-        self._NewInviteLink()
+        invite_link = self._NewInviteLink()
+        self._SendMessage(self.translator.GetSentence("INVITE_LINK_ALL_CMD"))
+        self._SendInviteLinkToAuthUsers(invite_link)
 
 
 #
@@ -199,12 +254,17 @@ class VersionCmd(CommandBase):
 # Command for checking users with no username
 #
 class CheckNoUsernameCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
+        chat = self.cmd_data.Chat()
+        chat_title = ChatHelper.GetTitle(chat)
+
         # Get chat members
-        chat_members = MembersUsernameGetter(self.client, self.config).GetAllWithNoUsername(self.cmd_data.Chat())
+        chat_members = MembersUsernameGetter(self.client, self.config).GetAllWithNoUsername(chat)
 
         # Build message
         if chat_members.Any():
@@ -212,67 +272,48 @@ class CheckNoUsernameCmd(CommandBase):
             left_hours = self.cmd_data.Params().GetAsInt(0, 0)
 
             msg = self.translator.GetSentence("CHECK_NO_USERNAME_NOTICE_CMD",
-                                              chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()),
+                                              chat_title=chat_title,
                                               members_count=chat_members.Count(),
                                               members_list=str(chat_members),
-                                              hours_left=self.__HoursToStr(left_hours))
+                                              hours_left=_CommandsUtils.HoursLeftToStr(self.translator, left_hours))
 
             # Add contact information if any
-            support_email = self.config.GetValue(BotConfigTypes.SUPPORT_EMAIL)
-            support_tg = self.config.GetValue(BotConfigTypes.SUPPORT_TELEGRAM)
-            if support_email != "" and support_tg != "":
-                msg += self.translator.GetSentence("CHECK_NO_USERNAME_EMAIL_TG_CMD",
-                                                   support_email=support_email,
-                                                   support_telegram=support_tg)
-            elif support_email != "":
-                msg += self.translator.GetSentence("CHECK_NO_USERNAME_ONLY_EMAIL_CMD",
-                                                   support_email=support_email)
-            elif support_tg != "":
-                msg += self.translator.GetSentence("CHECK_NO_USERNAME_ONLY_TG_CMD",
-                                                   support_telegram=support_tg)
+            msg += _CommandsUtils.GetContactInfo(self.config,
+                                                 self.translator,
+                                                 _CommandsUtils.CHECK_NO_USERNAME_CONTACT_SENTENCES)
         else:
             msg = self.translator.GetSentence("CHECK_NO_USERNAME_ALL_OK_CMD",
-                                              chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()))
+                                              chat_title=chat_title)
 
         # Send message
         self._SendMessage(msg)
 
-    # Get time string
-    def __HoursToStr(self,
-                     hours: int) -> str:
-        if hours > 47:
-            hours_str = self.translator.GetSentence("WITHIN_DAYS_MSG",
-                                                    days=hours // 24)
-        elif hours > 1:
-            hours_str = self.translator.GetSentence("WITHIN_HOURS_MSG",
-                                                    hours=hours)
-        else:
-            hours_str = self.translator.GetSentence("ASAP_MSG")
-        return hours_str
-
 
 #
 # Command for removing users with no username
 #
 class RemoveNoUsernameCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
+        chat = self.cmd_data.Chat()
+
         # Notice before removing
         self._SendMessage(
             self.translator.GetSentence("REMOVE_NO_USERNAME_NOTICE_CMD",
-                                        chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()))
+                                        chat_title=ChatHelper.GetTitle(chat))
         )
 
         finished = False
         kicked_members = ChatMembersList()
+        members_kicker = MembersKicker(self.client, self.config, self.logger)
         # Continue until all members have been kicked
         # Useful in channels when at maximum 200 members can be kicked at once
         while not finished:
-            curr_kicked_members = MembersKicker(self.client,
-                                                self.config,
-                                                self.logger).KickAllWithNoUsername(self.cmd_data.Chat())
+            curr_kicked_members = members_kicker.KickAllWithNoUsername(chat)
             if curr_kicked_members.Any():
                 kicked_members.AddMultiple(curr_kicked_members)
                 # Stop if test mode to avoid infinite looping (members are not really kicked in test mode)
@@ -287,11 +328,21 @@ class RemoveNoUsernameCmd(CommandBase):
             msg += self.translator.GetSentence("REMOVE_NO_USERNAME_LIST_CMD",
                                                members_list=str(kicked_members))
 
-        # Send message
-        self._SendMessage(msg)
-        # Generate new invite link if necessary
-        if kicked_members.Any():
-            self._NewInviteLink()
+        # Send message together with the invite link one, if any
+        msg_buffer = self._NewMessageBuffer()
+        msg_buffer.Add(msg)
+        invite_link = None
+        try:
+            # Generate new invite link if necessary
+            if kicked_members.Any():
+                invite_link = self._NewInviteLink()
+                msg_buffer.Add(self.translator.GetSentence("INVITE_LINK_ALL_CMD"))
+        finally:
+            # Always report the kicked members, even if the invite link cannot be generated
+            msg_buffer.Flush()
+
+        if invite_link is not None:
+            self._SendInviteLinkToAuthUsers(invite_link)
 
 
 #
@@ -345,18 +396,24 @@ class CheckPaymentsDataCmd(CommandBase):
 
         # Check results
         if payments_data_err.Any():
-            msg = self.translator.GetSentence("CHECK_PAYMENTS_DATA_COMPLETED_CMD",
-                                              errors_count=payments_data_err.Count())
+            # Collect message parts and join them at the end, since there may be many errors
+            msg_parts = [
+                self.translator.GetSentence("CHECK_PAYMENTS_DATA_COMPLETED_CMD",
+                                            errors_count=payments_data_err.Count())
+            ]
 
             for payment_err in payments_data_err:
-                if payment_err.Type() == PaymentErrorTypes.DUPLICATED_DATA_ERR:
-                    msg += self.translator.GetSentence("CHECK_PAYMENTS_DATA_DUPLICATED_ERR_CMD",
-                                                       row_index=payment_err.Row())
-                elif payment_err.Type() == PaymentErrorTypes.INVALID_DATE_ERR:
-                    msg += self.translator.GetSentence("CHECK_PAYMENTS_DATA_DATE_ERR_CMD",
-                                                       user=payment_err.User(),
-                                                       row_index=payment_err.Row(),
-                                                       expiration_date=payment_err.ExpirationDate())
+                # Sentences just ignore the error fields they don't use
+                sentence_id = _CommandsUtils.PAYMENT_ERR_SENTENCES.get(payment_err.Type())
+                if sentence_id is not None:
+                    msg_parts.append(
+                        self.translator.GetSentence(sentence_id,
+                                                    user=payment_err.User(),
+                                                    row_index=payment_err.Row(),
+                                                    expiration_date=payment_err.ExpirationDate())
+                    )
+
+            msg = "".join(msg_parts)
         else:
             msg = self.translator.GetSentence("CHECK_PAYMENTS_DATA_ALL_OK_CMD")
 
@@ -391,15 +448,9 @@ class EmailNoPaymentCmd(CommandBase):
 
                 # Build message
                 if expired_payments.Any():
-                    # Build strings for easier reading
-                    days_left_str = (self.translator.GetSentence("IN_DAYS_MSG", days=days_left)
-                                     if days_left > 1 else
-                                     (self.translator.GetSentence("TOMORROW_MSG")
-                                      if days_left == 1 else
-                                      self.translator.GetSentence("TODAY_MSG")))
-
                     msg = self.translator.GetSentence("EMAIL_NO_PAYMENT_COMPLETED_CMD",
-                                                      days_left=days_left_str,
+                                                      days_left=_CommandsUtils.DaysLeftToStr(self.translator,
+                                                                                             days_left),
                                                       members_count=expired_payments.Count(),
                                                       members_list=str(expired_payments))
                 else:
@@ -416,34 +467,42 @@ class EmailNoPaymentCmd(CommandBase):
 # Command for checking users with no payment
 #
 class CheckNoPaymentCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
         # Get parameters
         days_left = self.cmd_data.Params().GetAsInt(0, 0)
         last_day = self.cmd_data.Params().GetAsInt(1, 0)
 
-        # Notice before checking
-        self._SendMessage(
-            self.translator.GetSentence("CHECK_NO_PAYMENT_NOTICE_CMD",
-                                        chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()))
-        )
+        chat = self.cmd_data.Chat()
+        chat_title = ChatHelper.GetTitle(chat)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start getting expired members in background, so that it overlaps with the notice
+            expired_members_future = executor.submit(
+                MembersPaymentGetter(self.client,
+                                     self.config,
+                                     self.logger).GetAllMembersWithExpiringPayment,
+                chat,
+                days_left
+            )
+
+            # Notice before checking
+            self._SendMessage(
+                self.translator.GetSentence("CHECK_NO_PAYMENT_NOTICE_CMD",
+                                            chat_title=chat_title)
+            )
 
         # Get expired members
-        expired_members = MembersPaymentGetter(self.client,
-                                               self.config,
-                                               self.logger).GetAllMembersWithExpiringPayment(self.cmd_data.Chat(),
-                                                                                             days_left)
+        expired_members = expired_members_future.result()
 
         # Build message
         if expired_members.Any():
             # Build strings for easier reading
-            days_left_str = (self.translator.GetSentence("IN_DAYS_MSG", days=days_left)
-                             if days_left > 1 else
-                             (self.translator.GetSentence("TOMORROW_MSG")
-                              if days_left == 1 else
-                              self.translator.GetSentence("TODAY_MSG")))
+            days_left_str = _CommandsUtils.DaysLeftToStr(self.translator, days_left)
             last_day_str = (self.translator.GetSentence("DAY_OF_MONTH_MSG", day_of_month=last_day)
                             if 1 <= last_day <= 31
                             else self.translator.GetSentence("FEW_DAYS_MSG"))
@@ -462,21 +521,12 @@ class CheckNoPaymentCmd(CommandBase):
                                                    website=website)
 
             # Add contact information if any
-            support_email = self.config.GetValue(BotConfigTypes.SUPPORT_EMAIL)
-            support_tg = self.config.GetValue(BotConfigTypes.SUPPORT_TELEGRAM)
-            if support_email != "" and support_tg != "":
-                msg += self.translator.GetSentence("CHECK_NO_PAYMENT_EMAIL_TG_CMD",
-                                                   support_email=support_email,
-                                                   support_telegram=support_tg)
-            elif support_email != "":
-                msg += self.translator.GetSentence("CHECK_NO_PAYMENT_ONLY_EMAIL_CMD",
-                                                   support_email=support_email)
-            elif support_tg != "":
-                msg += self.translator.GetSentence("CHECK_NO_PAYMENT_ONLY_TG_CMD",
-                                                   support_telegram=support_tg)
+            msg += _CommandsUtils.GetContactInfo(self.config,
+                                                 self.translator,
+                                                 _CommandsUtils.CHECK_NO_PAYMENT_CONTACT_SENTENCES)
         else:
             msg = self.translator.GetSentence("CHECK_NO_PAYMENT_ALL_OK_CMD",
-                                              chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()))
+                                              chat_title=chat_title)
 
         # Send message
         self._SendMessage(msg)
@@ -486,24 +536,27 @@ class CheckNoPaymentCmd(CommandBase):
 # Command for removing users with no payment
 #
 class RemoveNoPaymentCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
+        chat = self.cmd_data.Chat()
+
         # Notice before removing
         self._SendMessage(
             self.translator.GetSentence("REMOVE_NO_PAYMENT_NOTICE_CMD",
-                                        chat_title=ChatHelper.GetTitle(self.cmd_data.Chat()))
+                                        chat_title=ChatHelper.GetTitle(chat))
         )
 
         finished = False
         kicked_members = ChatMembersList()
+        members_kicker = MembersKicker(self.client, self.config, self.logger)
         # Continue until all members have been kicked
         # Useful in channels when at maximum 200 members can be kicked at once
         while not finished:
-            curr_kicked_members = MembersKicker(self.client,
-                                                self.config,
-                                                self.logger).KickAllWithExpiredPayment(self.cmd_data.Chat())
+            curr_kicked_members = members_kicker.KickAllWithExpiredPayment(chat)
             if curr_kicked_members.Any():
                 kicked_members.AddMultiple(curr_kicked_members)
                 # Stop if test mode to avoid infinite looping (members are not really kicked in test mode)
@@ -518,11 +571,21 @@ class RemoveNoPaymentCmd(CommandBase):
             msg += self.translator.GetSentence("REMOVE_NO_PAYMENT_LIST_CMD",
                                                members_list=str(kicked_members))
 
-        # Send message
-        self._SendMessage(msg)
-        # Generate new invite link if necessary
-        if kicked_members.Any():
-            self._NewInviteLink()
+        # Send message together with the invite link one, if any
+        msg_buffer = self._NewMessageBuffer()
+        msg_buffer.Add(msg)
+        invite_link = None
+        try:
+            # Generate new invite link if necessary
+            if kicked_members.Any():
+                invite_link = self._NewInviteLink()
+                msg_buffer.Add(self.translator.GetSentence("INVITE_LINK_ALL_CMD"))
+        finally:
+            # Always report the kicked members, even if the invite link cannot be generated
+            msg_buffer.Flush()
+
+        if invite_link is not None:
+            self._SendInviteLinkToAuthUsers(invite_link)
 
 
 #
@@ -565,8 +628,10 @@ class PaymentTaskStopCmd(CommandBase):
 # Command for adding current chat to payment task
 #
 class PaymentTaskAddChatCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
         try:
@@ -580,8 +645,10 @@ class PaymentTaskAddChatCmd(CommandBase):
 # Command for removing current chat to payment task
 #
 class PaymentTaskRemoveChatCmd(CommandBase):
+
+    GROUP_CHAT_ONLY = True
+
     # Execute command
-    @GroupChatOnly
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
         try:
@@ -609,9 +676,10 @@ class PaymentTaskInfoCmd(CommandBase):
     # Execute command
     def _ExecuteCommand(self,
                         **kwargs: Any) -> None:
-        is_running = kwargs["payments_check_scheduler"].IsRunning()
-        period = kwargs["payments_check_scheduler"].GetPeriod()
-        chats = kwargs["payments_check_scheduler"].GetChats()
+        payments_check_scheduler = kwargs["payments_check_scheduler"]
+        is_running = payments_check_scheduler.IsRunning()
+        period = payments_check_scheduler.GetPeriod()
+        chats = payments_check_scheduler.GetChats()
 
         state = (self.translator.GetSentence("TASK_RUNNING_MSG")
                  if is_running
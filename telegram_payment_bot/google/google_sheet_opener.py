@@ -21,7 +21,8 @@
 #
 # Imports
 #
-from typing import Optional
+from threading import Lock
+from typing import Dict, Tuple
 
 import pygsheets
 
@@ -38,10 +39,12 @@ from telegram_payment_bot.logger.logger import Logger
 # Google Sheet opener class
 class GoogleSheetOpener:
 
+    # Authorized Google clients, shared between openers so that authorization and connections are reused
+    # Only clients are shared: spreadsheets are opened every time, so that their worksheets and sizes are up to date
+    google_clients_cache: Dict[Tuple[str, GoogleCredTypes], pygsheets.client.Client] = {}
+    google_clients_cache_lock: Lock = Lock()
     config: ConfigObject
     logger: Logger
-    gsheet: ConfigObject
-    worksheet: Optional[pygsheets.Spreadsheet]
 
     # Constructor
     def __init__(self,
@@ -49,31 +52,40 @@ class GoogleSheetOpener:
                  logger: Logger) -> None:
         self.config = config
         self.logger = logger
-        self.google_sheet = None
 
     # Open worksheet
     def OpenWorksheet(self,
                       worksheet_idx: int) -> pygsheets.Worksheet:
-        self.__OpenGoogleSheet()
-        assert self.google_sheet is not None
-        return self.google_sheet[worksheet_idx]
+        return self.__OpenGoogleSheet()[worksheet_idx]
 
     # Open Google Sheet
-    def __OpenGoogleSheet(self) -> None:
-        if self.google_sheet is not None:
-            return
+    def __OpenGoogleSheet(self) -> pygsheets.Spreadsheet:
+        sheet_id = self.config.GetValue(BotConfigTypes.PAYMENT_GOOGLE_SHEET_ID)
+        self.logger.GetLogger().info(f"Opening Google Sheet ID \"{sheet_id}\"...")
+
+        return self.__GetGoogleClient().open_by_key(sheet_id)
 
+    # Get Google client, authorizing it only the first time
+    def __GetGoogleClient(self) -> pygsheets.client.Client:
         # Get configuration
-        sheet_id = self.config.GetValue(BotConfigTypes.PAYMENT_GOOGLE_SHEET_ID)
         cred_file = self.config.GetValue(BotConfigTypes.PAYMENT_GOOGLE_CRED)
         cred_type = self.config.GetValue(BotConfigTypes.PAYMENT_GOOGLE_CRED_TYPE)
 
+        cache_key = (cred_file, cred_type)
+        with GoogleSheetOpener.google_clients_cache_lock:
+            if cache_key not in GoogleSheetOpener.google_clients_cache:
+                GoogleSheetOpener.google_clients_cache[cache_key] = self.__Authorize(cred_file, cred_type)
+            return GoogleSheetOpener.google_clients_cache[cache_key]
+
+    # Authorize Google client
+    def __Authorize(self,
+                    cred_file: str,
+                    cred_type: GoogleCredTypes) -> pygsheets.client.Client:
         # Log
         self.logger.GetLogger().info(f"Credential file: {cred_file}")
         self.logger.GetLogger().info(f"Credential type: {cred_type}")
-        self.logger.GetLogger().info(f"Opening Google Sheet ID \"{sheet_id}\"...")
 
-        # Authorize and open Google Sheet
+        # Authorize
         if cred_type == GoogleCredTypes.OAUTH2:
             cred_path = self.config.GetValue(BotConfigTypes.PAYMENT_GOOGLE_CRED_PATH)
             self.logger.GetLogger().info(f"Credential path: {cred_path}")
@@ -86,4 +98,4 @@ class GoogleSheetOpener:
         else:
             raise ValueError("Invalid credential type")
 
-        self.google_sheet = google_client.open_by_key(sheet_id)
+        return google_client
@@ -21,6 +21,7 @@
 #
 # Imports
 #
+from threading import Lock
 from typing import List
 
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -35,6 +36,8 @@ from telegram_payment_bot.logger.logger import Logger
 # Google Sheet rows getter class
 class GoogleSheetRowsGetter:
 
+    # Google clients are shared and their HTTP connections are not thread-safe, so requests are serialized
+    rows_lock: Lock = Lock()
     google_sheet_opener: GoogleSheetOpener
 
     # Constructor
@@ -46,9 +49,10 @@ class GoogleSheetRowsGetter:
     # Open worksheet
     def GetRows(self,
                 worksheet_idx: int) -> List[List[str]]:
-        worksheet = self.google_sheet_opener.OpenWorksheet(worksheet_idx)
-        return worksheet.get_all_values(
-            include_tailing_empty_rows=False,
-            include_tailing_empty=False,
-            returnas="matrix"
-        )
+        with GoogleSheetRowsGetter.rows_lock:
+            worksheet = self.google_sheet_opener.OpenWorksheet(worksheet_idx)
+            return worksheet.get_all_values(
+                include_tailing_empty_rows=False,
+                include_tailing_empty=False,
+                returnas="matrix"
+            )
@@ -22,8 +22,11 @@
 # Imports
 #
 import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
 
 import pyrogram
+import pyrogram.errors.exceptions as pyrogram_ex
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -32,6 +35,7 @@ from telegram_payment_bot.member.members_payment_getter import MembersPaymentGet
 from telegram_payment_bot.member.members_username_getter import MembersUsernameGetter
 from telegram_payment_bot.misc.ban_helper import BanHelper
 from telegram_payment_bot.misc.chat_members import ChatMembersList
+from telegram_payment_bot.misc.helpers import UserHelper
 
 
 #
@@ -40,13 +44,20 @@ from telegram_payment_bot.misc.chat_members import ChatMembersList
 
 # Constants for members kicker class
 class MembersKickerConst:
-    # Sleep time
-    SLEEP_TIME_SEC: float = 0.01
+    # Minimum time between two kicks, for all kickers together
+    # (i.e. at most 20 kicks per second, well below the Telegram limit of about 30 requests per second for bots)
+    KICK_INTERVAL_SEC: float = 0.05
+    # Maximum number of members kicked concurrently (kept low to avoid flood limits)
+    MAX_CONCURRENT_KICKS: int = 8
 
 
 # Members kicker class
 class MembersKicker:
 
+    # Time of the next kick, shared among all kickers since they can run concurrently
+    next_kick_time: float = 0.0
+    next_kick_time_lock: Lock = Lock()
+
     client: pyrogram.Client
     config: ConfigObject
     logger: Logger
@@ -66,12 +77,16 @@ class MembersKicker:
         self.members_payment_getter = MembersPaymentGetter(client, config, logger)
         self.members_username_getter = MembersUsernameGetter(client, config)
 
+    # Reload payment
+    def ReloadPayment(self) -> None:
+        self.members_payment_getter.ReloadPayment()
+
     # Kick all members with expired payment
     def KickAllWithExpiredPayment(self,
                                   chat: pyrogram.types.Chat) -> ChatMembersList:
         no_payment_members = self.members_payment_getter.GetAllMembersWithExpiredPayment(chat)
         if no_payment_members.Any():
-            self.__KickMultiple(chat, no_payment_members)
+            return self.__KickMultiple(chat, no_payment_members)
         return no_payment_members
 
     # Kick single member if expired payment
@@ -88,7 +103,7 @@ class MembersKicker:
                               chat: pyrogram.types.Chat) -> ChatMembersList:
         no_username_members = self.members_username_getter.GetAllWithNoUsername(chat)
         if no_username_members.Any():
-            self.__KickMultiple(chat, no_username_members)
+            return self.__KickMultiple(chat, no_username_members)
         return no_username_members
 
     # Kick single member if no username
@@ -105,17 +120,66 @@ class MembersKicker:
                      chat: pyrogram.types.Chat,
                      user: pyrogram.types.User) -> None:
         if not self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
+            MembersKicker.__WaitKickTime()
             self.ban_helper.KickUser(chat, user)
         else:
             self.logger.GetLogger().info("Test mode ON: no member was kicked")
 
-    # Kick multiple
+    # Kick multiple, returning the members that were actually kicked
     def __KickMultiple(self,
                        chat: pyrogram.types.Chat,
-                       members: ChatMembersList) -> None:
-        if not self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
-            for member in members:
-                self.ban_helper.KickUser(chat, member.user)
-                time.sleep(MembersKickerConst.SLEEP_TIME_SEC)
-        else:
+                       members: ChatMembersList) -> ChatMembersList:
+        if self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
             self.logger.GetLogger().info("Test mode ON: no member was kicked")
+            return members
+
+        # Kick members concurrently, since each kick is a request that has to wait for the server
+        # Results are consumed to propagate exceptions, if any
+        stop_event = Event()
+        with ThreadPoolExecutor(max_workers=MembersKickerConst.MAX_CONCURRENT_KICKS) as executor:
+            kick_results = list(executor.map(lambda member: self.__KickMember(chat, member, stop_event), members))
+
+        kicked_members = ChatMembersList()
+        kicked_members.AddMultiple(
+            [member for member, is_kicked in zip(members, kick_results) if is_kicked]
+        )
+        return kicked_members
+
+    # Kick member, returning if it was kicked
+    # The stop event is set on the first error not specific to the member, so the remaining kicks are skipped
+    def __KickMember(self,
+                     chat: pyrogram.types.Chat,
+                     member: pyrogram.types.ChatMember,
+                     stop_event: Event) -> bool:
+        if stop_event.is_set():
+            return False
+        MembersKicker.__WaitKickTime()
+        if stop_event.is_set():
+            return False
+
+        try:
+            self.ban_helper.KickUser(chat, member.user)
+            return True
+        # It may happen if the member is an admin or is not in the chat anymore, just skip it
+        except (pyrogram_ex.bad_request_400.UserAdminInvalid,
+                pyrogram_ex.bad_request_400.UserNotParticipant):
+            self.logger.GetLogger().error(
+                f"Unable to kick member: {UserHelper.GetNameOrId(member.user)}"
+            )
+            return False
+        # Any other error (e.g. bot is not admin, flood wait) would fail for the remaining members too
+        except Exception:
+            stop_event.set()
+            raise
+
+    # Wait until the next kick is allowed
+    @staticmethod
+    def __WaitKickTime() -> None:
+        # Reserve the next time slot, so that the total kick rate is limited regardless of the number of threads
+        with MembersKicker.next_kick_time_lock:
+            curr_time = time.monotonic()
+            kick_time = max(curr_time, MembersKicker.next_kick_time)
+            MembersKicker.next_kick_time = kick_time + MembersKickerConst.KICK_INTERVAL_SEC
+
+        if kick_time > curr_time:
+            time.sleep(kick_time - curr_time)
@@ -21,6 +21,7 @@
 #
 # Imports
 #
+from threading import Lock
 from typing import Any, Dict, Optional
 
 import pyrogram
@@ -46,6 +47,7 @@ class MembersPaymentGetter:
     config: ConfigObject
     logger: Logger
     payments_loader: PaymentsLoaderBase
+    payments_cache_lock: Lock
     payments_cache: Optional[PaymentsData]
     single_payment_cache: Optional[Dict[str, Any]]
 
@@ -58,6 +60,7 @@ class MembersPaymentGetter:
         self.config = config
         self.logger = logger
         self.payments_loader = PaymentsLoaderFactory(config, logger).CreateLoader()
+        self.payments_cache_lock = Lock()
         self.payments_cache = None
         self.single_payment_cache = None
 
@@ -154,10 +157,12 @@ class MembersPaymentGetter:
     # Get all payments
     def __GetAllPayments(self) -> PaymentsData:
         # Load only the first time
-        if self.payments_cache is None:
-            self.payments_cache = self.payments_loader.LoadAll()
+        # Lock, so that payments are loaded only once if the getter is shared among threads
+        with self.payments_cache_lock:
+            if self.payments_cache is None:
+                self.payments_cache = self.payments_loader.LoadAll()
 
-        return self.payments_cache
+            return self.payments_cache
 
     # Get single payment
     def __GetSinglePayment(self,
@@ -36,6 +36,9 @@ from telegram_payment_bot.utils.wrapped_list import WrappedList
 
 # Chat members list class
 class ChatMembersList(WrappedList):
+
+    __slots__ = ()
+
     # Get by user ID
     def GetByUserId(self,
                     user_id: int) -> Optional[pyrogram.types.ChatMember]:
@@ -0,0 +1,96 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#
+# Imports
+#
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
+from telegram_payment_bot.config.config_object import ConfigObject
+from telegram_payment_bot.logger.logger import Logger
+from telegram_payment_bot.misc.user import User
+from telegram_payment_bot.payment.payments_data import PaymentsData, PaymentsDataErrors, SinglePayment
+from telegram_payment_bot.payment.payments_loader_base import PaymentsLoaderBase
+
+
+#
+# Classes
+#
+
+# Payments cached loader class
+# Payments loaded by the wrapped loader are reused until the configured time expires or the source changes
+class PaymentsCachedLoader(PaymentsLoaderBase):
+
+    # Cached payments for each configuration: (load time, source version, payments data)
+    # The cache is shared because loaders are created every time they are needed
+    cache: WeakKeyDictionary[ConfigObject, Tuple[float, Optional[Any], PaymentsData]] = WeakKeyDictionary()
+    cache_lock: Lock = Lock()
+    loader: PaymentsLoaderBase
+
+    # Constructor
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 loader: PaymentsLoaderBase) -> None:
+        super().__init__(config, logger)
+        self.loader = loader
+
+    # Load all payments
+    def LoadAll(self) -> PaymentsData:
+        source_version = self.loader.GetSourceVersion()
+
+        # Lock, so that concurrent callers wait for a single load
+        with PaymentsCachedLoader.cache_lock:
+            cached = PaymentsCachedLoader.cache.get(self.config)
+            if cached is not None and self.__IsValid(cached[0], cached[1], source_version):
+                self.logger.GetLogger().info("Payments data taken from cache")
+                return cached[2]
+
+            payments_data = self.loader.LoadAll()
+            PaymentsCachedLoader.cache[self.config] = (time.monotonic(), source_version, payments_data)
+
+            return payments_data
+
+    # Load single payment by user
+    def LoadSingleByUser(self,
+                         user: User) -> Optional[SinglePayment]:
+        return self.LoadAll().GetByUser(user)
+
+    # Check for errors (never cached, since it is used for checking data after modifying it)
+    def CheckForErrors(self) -> PaymentsDataErrors:
+        return self.loader.CheckForErrors()
+
+    # Get source version
+    def GetSourceVersion(self) -> Optional[Any]:
+        return self.loader.GetSourceVersion()
+
+    # Get if cached data is still valid
+    def __IsValid(self,
+                  load_time: float,
+                  cached_source_version: Optional[Any],
+                  source_version: Optional[Any]) -> bool:
+        return (time.monotonic() - load_time < self.config.GetValue(BotConfigTypes.PAYMENT_CACHE_TTL_SEC) and
+                cached_source_version == source_version)
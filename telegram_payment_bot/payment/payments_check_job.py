@@ -21,6 +21,7 @@
 #
 # Imports
 #
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 
 import pyrogram
@@ -38,12 +39,18 @@ from telegram_payment_bot.utils.wrapped_dict import WrappedDict
 # Classes
 #
 
+# Constants for payments check job class
+class PaymentsCheckJobConst:
+    # Maximum number of chats checked concurrently (each chat kicks its members concurrently too)
+    MAX_CONCURRENT_CHATS: int = 4
+
+
 # Payments check job chats class
 class PaymentsCheckJobChats(WrappedDict):
     # Convert to string
     def ToString(self) -> str:
         return "\n".join(
-            [f"- {ChatHelper.GetTitle(chat)}" for _, chat in self.dict_elements.items()]
+            [f"- {ChatHelper.GetTitle(chat)}" for chat in self.dict_elements.values()]
         )
 
     # Convert to string
@@ -61,6 +68,7 @@ class PaymentsCheckJob:
     job_chats_lock: Lock
     period: int
     auth_users_msg_sender: AuthorizedUsersMessageSender
+    members_kicker: MembersKicker
     job_chats: PaymentsCheckJobChats
 
     # Constructor
@@ -76,6 +84,7 @@ class PaymentsCheckJob:
         self.job_chats_lock = Lock()
         self.period = 0
         self.auth_users_msg_sender = AuthorizedUsersMessageSender(client, config, logger)
+        self.members_kicker = MembersKicker(client, config, logger)
         self.job_chats = PaymentsCheckJobChats()
 
     # Get period
@@ -90,7 +99,7 @@ class PaymentsCheckJob:
     # Add chat
     def AddChat(self,
                 chat: pyrogram.types.Chat) -> bool:
-        # Prevent accidental modifications while job is executing
+        # Prevent concurrent modifications
         with self.job_chats_lock:
             if self.job_chats.IsKey(chat.id):
                 return False
@@ -101,7 +110,7 @@ class PaymentsCheckJob:
     # Remove chat
     def RemoveChat(self,
                    chat: pyrogram.types.Chat) -> bool:
-        # Prevent accidental modifications while job is executing
+        # Prevent concurrent modifications
         with self.job_chats_lock:
             if not self.job_chats.IsKey(chat.id):
                 return False
@@ -111,7 +120,7 @@ class PaymentsCheckJob:
 
     # Remove all chats
     def RemoveAllChats(self) -> None:
-        # Prevent accidental modifications while job is executing
+        # Prevent concurrent modifications
         with self.job_chats_lock:
             self.job_chats.Clear()
 
@@ -121,35 +130,45 @@ class PaymentsCheckJob:
 
     # Do job
     def DoJob(self) -> None:
+        logger = self.logger.GetLogger()
+
         # Log
-        self.logger.GetLogger().info("Payments check job started")
+        logger.info("Payments check job started")
 
-        # Lock
+        # Take a snapshot of the chats, so that they can be modified while the job is executing
         with self.job_chats_lock:
-            # Exit if no chats
-            if self.job_chats.Empty():
-                self.logger.GetLogger().info("No chat to check, exiting...")
-                return
+            chats = tuple(self.job_chats.Values())
+
+        # Exit if no chats
+        if len(chats) == 0:
+            logger.info("No chat to check, exiting...")
+            return
 
-            # Kick members for each chat
-            members_kicker = MembersKicker(self.client, self.config, self.logger)
-            for chat in self.job_chats.Values():
-                self.__KickMembersInChat(chat, members_kicker)
+        # Payments may have changed since the last run
+        self.members_kicker.ReloadPayment()
+
+        # Kick members in chats concurrently, since it is mostly waiting for the server
+        # Results are consumed to propagate exceptions, if any
+        max_workers = min(PaymentsCheckJobConst.MAX_CONCURRENT_CHATS, len(chats))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self.__KickMembersInChat, chats))
 
     # Kick members in chat
     def __KickMembersInChat(self,
-                            chat: pyrogram.types.Chat,
-                            members_kicker: MembersKicker) -> None:
+                            chat: pyrogram.types.Chat) -> None:
+        logger = self.logger.GetLogger()
+        chat_title_or_id = ChatHelper.GetTitleOrId(chat)
+
         # Kick all members
-        self.logger.GetLogger().info(f"Checking payments for chat {ChatHelper.GetTitleOrId(chat)}...")
-        kicked_members = members_kicker.KickAllWithExpiredPayment(chat)
+        logger.info("Checking payments for chat %s...", chat_title_or_id)
+        kicked_members = self.members_kicker.KickAllWithExpiredPayment(chat)
 
         # Log kicked members
-        self.logger.GetLogger().info(
-            f"Kicked members for chat {ChatHelper.GetTitleOrId(chat)}: {kicked_members.Count()}"
-        )
+        logger.info("Kicked members for chat %s: %d", chat_title_or_id, kicked_members.Count())
         if kicked_members.Any():
-            self.logger.GetLogger().info(str(kicked_members))
+            # Build list only once, it is used for both logging and message
+            kicked_members_str = str(kicked_members)
+            logger.info(kicked_members_str)
 
             # Inform authorized users
             msg = self.translator.GetSentence("REMOVE_NO_PAYMENT_NOTICE_CMD",
@@ -158,6 +177,6 @@ class PaymentsCheckJob:
             msg += self.translator.GetSentence("REMOVE_NO_PAYMENT_COMPLETED_CMD",
                                                members_count=kicked_members.Count())
             msg += self.translator.GetSentence("REMOVE_NO_PAYMENT_LIST_CMD",
-                                               members_list=str(kicked_members))
+                                               members_list=kicked_members_str)
 
             self.auth_users_msg_sender.SendMessage(chat, msg)
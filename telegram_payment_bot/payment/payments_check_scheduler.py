@@ -22,6 +22,7 @@
 # Imports
 #
 import pyrogram
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
@@ -68,6 +69,8 @@ class PaymentsCheckSchedulerConst:
     MAX_PERIOD_HOURS: int = 24
     # Job ID
     JOB_ID: str = "payment_check_job"
+    # Number of scheduler workers (the job already checks chats concurrently by itself)
+    WORKERS: int = 1
 
 
 # Payments check scheduler class
@@ -87,7 +90,11 @@ class PaymentsCheckScheduler:
         self.config = config
         self.logger = logger
         self.payments_checker_job = PaymentsCheckJob(client, config, logger, translator)
-        self.scheduler = BackgroundScheduler()
+        # Coalesce missed runs, so a late job runs only once instead of piling up
+        self.scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(PaymentsCheckSchedulerConst.WORKERS)},
+            job_defaults={"coalesce": True}
+        )
         self.scheduler.start()
 
     # Get chats
@@ -24,8 +24,9 @@
 from __future__ import annotations
 
 import datetime
+import typing
 from enum import Enum, auto, unique
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -137,6 +138,9 @@ class PaymentError:
 
 # Payments data error class
 class PaymentsDataErrors(WrappedList):
+
+    __slots__ = ()
+
     # Add payment error
     def AddPaymentError(self,
                         err_type: PaymentErrorTypes,
@@ -150,12 +154,42 @@ class PaymentsDataErrors(WrappedList):
 class PaymentsData(WrappedDict):
 
     config: ConfigObject
+    email_index: Optional[Dict[str, SinglePayment]]
 
     # Constructor
     def __init__(self,
                  config: ConfigObject) -> None:
         super().__init__()
         self.config = config
+        self.email_index = {}
+
+    # Add single element
+    def AddSingle(self,
+                  key: typing.Any,
+                  value: typing.Any) -> None:
+        # If a payment is replaced, the index is rebuilt when needed
+        if self.IsKey(key):
+            self.email_index = None
+        elif self.email_index is not None:
+            self.email_index.setdefault(value.Email(), value)
+        super().AddSingle(key, value)
+
+    # Add multiple elements
+    def AddMultiple(self,
+                    elements: Union[Dict[typing.Any, typing.Any], WrappedDict]) -> None:
+        self.email_index = None
+        super().AddMultiple(elements)
+
+    # Remove single element
+    def RemoveSingle(self,
+                     key: typing.Any) -> None:
+        self.email_index = None
+        super().RemoveSingle(key)
+
+    # Clear element
+    def Clear(self) -> None:
+        self.email_index = None
+        super().Clear()
 
     # Add payment
     def AddPayment(self,
@@ -176,10 +210,7 @@ class PaymentsData(WrappedDict):
     # Get by email
     def GetByEmail(self,
                    email: str) -> Optional[SinglePayment]:
-        for _, payment in self.dict_elements.items():
-            if email == payment.Email():
-                return payment
-        return None
+        return self.__GetEmailIndex().get(email)
 
     # Get by user
     def GetByUser(self,
@@ -238,10 +269,31 @@ class PaymentsData(WrappedDict):
 
         return payments
 
+    # Get email index (email -> first payment with that email), building it if necessary
+    def __GetEmailIndex(self) -> Dict[str, SinglePayment]:
+        if self.email_index is None:
+            self.email_index = {}
+            for payment in self.dict_elements.values():
+                self.email_index.setdefault(payment.Email(), payment)
+        return self.email_index
+
+    # Delete item
+    def __delitem__(self,
+                    key: typing.Any):
+        self.email_index = None
+        super().__delitem__(key)
+
+    # Set item
+    def __setitem__(self,
+                    key: typing.Any,
+                    value: typing.Any):
+        self.email_index = None
+        super().__setitem__(key, value)
+
     # Convert to string
     def ToString(self) -> str:
         return "\n".join(
-            [f"- {str(payment)}" for _, payment in self.dict_elements.items()]
+            [f"- {str(payment)}" for payment in self.dict_elements.values()]
         )
 
     # Convert to string
@@ -21,6 +21,7 @@
 #
 # Imports
 #
+import os
 from datetime import datetime
 from typing import Any, Optional, Tuple
 
@@ -59,6 +60,13 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
     def CheckForErrors(self) -> PaymentsDataErrors:
         return self.__LoadAndCheckAll()[1]
 
+    # Get source version (file modification time)
+    def GetSourceVersion(self) -> Optional[Any]:
+        try:
+            return os.path.getmtime(self.config.GetValue(BotConfigTypes.PAYMENT_EXCEL_FILE))
+        except OSError:
+            return None
+
     # Load and check all payments
     def __LoadAndCheckAll(self) -> Tuple[PaymentsData, PaymentsDataErrors]:
         # Get payment file
@@ -95,6 +103,8 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
         email_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EMAIL_COL))
         user_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_USER_COL))
         expiration_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EXPIRATION_COL))
+        # Get date format
+        date_format = self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)
 
         # Read each row
         for i in range(sheet.nrows):
@@ -107,7 +117,7 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
 
                 # Skip invalid users
                 if user.IsValid():
-                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration)
+                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration, date_format)
 
         return payments_data, payments_data_err
 
@@ -118,14 +128,14 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
                      payments_data_err: PaymentsDataErrors,
                      email: str,
                      user: User,
-                     expiration: Any) -> None:
+                     expiration: Any,
+                     date_format: str) -> None:
         # In Excel, a date can be a number or a string
         try:
             expiration_datetime = xlrd.xldate_as_datetime(expiration, 0).date()
         except TypeError:
             try:
-                expiration_datetime = datetime.strptime(expiration.strip(),
-                                                        self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)).date()
+                expiration_datetime = datetime.strptime(expiration.strip(), date_format).date()
             except ValueError:
                 self.logger.GetLogger().warning(
                     f"Expiration date for user {user} at row {row_idx} is not valid ({expiration}), skipped"
@@ -139,8 +149,9 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
 
         # Add data
         if payments_data.AddPayment(email, user, expiration_datetime):
+            # Formatting is done by the logger, only if the message is actually logged
             self.logger.GetLogger().debug(
-                f"{payments_data.Count():4d} - Row {row_idx:4d} | {email} | {user} | {expiration_datetime}"
+                "%4d - Row %4d | %s | %s | %s", payments_data.Count(), row_idx, email, user, expiration_datetime
             )
         else:
             self.logger.GetLogger().warning(
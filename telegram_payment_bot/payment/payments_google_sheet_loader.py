@@ -87,6 +87,8 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
         email_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EMAIL_COL))
         user_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_USER_COL))
         expiration_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EXPIRATION_COL))
+        # Get date format
+        date_format = self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)
 
         # Get all rows
         rows = self.google_sheet_rows_getter.GetRows(
@@ -111,7 +113,7 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
             else:
                 # Skip invalid users
                 if user.IsValid():
-                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration)
+                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration, date_format)
 
         return payments_data, payments_data_err
 
@@ -122,11 +124,11 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
                      payments_data_err: PaymentsDataErrors,
                      email: str,
                      user: User,
-                     expiration: str) -> None:
+                     expiration: str,
+                     date_format: str) -> None:
         # Convert date to datetime object
         try:
-            expiration_datetime = datetime.strptime(expiration,
-                                                    self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)).date()
+            expiration_datetime = datetime.strptime(expiration, date_format).date()
         except ValueError:
             self.logger.GetLogger().warning(
                 f"Expiration date for user {user} at row {row_idx} is not valid ({expiration}), skipped"
@@ -140,8 +142,9 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
 
         # Add data
         if payments_data.AddPayment(email, user, expiration_datetime):
+            # Formatting is done by the logger, only if the message is actually logged
             self.logger.GetLogger().debug(
-                f"{payments_data.Count():4d} - Row {row_idx:4d} | {email} | {user} | {expiration_datetime}"
+                "%4d - Row %4d | %s | %s | %s", payments_data.Count(), row_idx, email, user, expiration_datetime
             )
         else:
             self.logger.GetLogger().warning(
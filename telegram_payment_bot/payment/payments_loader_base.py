@@ -22,7 +22,7 @@
 # Imports
 #
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 from telegram_payment_bot.config.config_object import ConfigObject
 from telegram_payment_bot.logger.logger import Logger
@@ -63,6 +63,10 @@ class PaymentsLoaderBase(ABC):
     def CheckForErrors(self) -> PaymentsDataErrors:
         pass
 
+    # Get source version, used for detecting changes in payments data (None if not available)
+    def GetSourceVersion(self) -> Optional[Any]:
+        return None
+
     # Convert column string to index
     @staticmethod
     def _ColumnToIndex(col: str) -> int:
@@ -25,6 +25,7 @@ from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
 from telegram_payment_bot.logger.logger import Logger
 from telegram_payment_bot.payment.payment_types import PaymentTypes
+from telegram_payment_bot.payment.payments_cached_loader import PaymentsCachedLoader
 from telegram_payment_bot.payment.payments_excel_loader import PaymentsExcelLoader
 from telegram_payment_bot.payment.payments_google_sheet_loader import PaymentsGoogleSheetLoader
 from telegram_payment_bot.payment.payments_loader_base import PaymentsLoaderBase
@@ -54,6 +55,13 @@ class PaymentsLoaderFactory:
 
     # Create loader
     def CreateLoader(self) -> PaymentsLoaderBase:
+        loader = self.__CreateSourceLoader()
+        if self.config.GetValue(BotConfigTypes.PAYMENT_CACHE_TTL_SEC) > 0:
+            return PaymentsCachedLoader(self.config, self.logger, loader)
+        return loader
+
+    # Create loader for the configured payment source
+    def __CreateSourceLoader(self) -> PaymentsLoaderBase:
         payment_type = self.config.GetValue(BotConfigTypes.PAYMENT_TYPE)
         if payment_type == PaymentTypes.EXCEL_FILE:
             return PaymentsExcelLoader(self.config, self.logger)
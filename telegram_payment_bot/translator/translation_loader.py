@@ -21,8 +21,10 @@
 #
 # Imports
 #
+import logging
 import os
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, Optional, Pattern
 
 from defusedxml import ElementTree
 
@@ -41,6 +43,16 @@ class TranslationLoaderConst:
     DEF_FILE_NAME: str = "lang_en.xml"
     # XML tag for sentences
     SENTENCE_XML_TAG: str = "sentence"
+    # Placeholder regex, used for sentences that are not valid format strings
+    PLACEHOLDER_REGEX: Pattern = re.compile(r"\{([^{}]+)\}")
+
+
+# Sentence parameters, missing ones are left as placeholders instead of raising
+class _SentenceParams(dict):
+    # Get missing key
+    def __missing__(self,
+                    key: str) -> str:
+        return "{" + key + "}"
 
 
 # Translation loader class
@@ -48,12 +60,14 @@ class TranslationLoader:
 
     logger: Logger
     sentences: Dict[str, str]
+    no_param_sentences: Dict[str, str]
 
     # Constructor
     def __init__(self,
                  logger: Logger) -> None:
         self.logger = logger
         self.sentences = {}
+        self.no_param_sentences = {}
 
     # Load translation file
     def Load(self,
@@ -62,42 +76,66 @@ class TranslationLoader:
                                      TranslationLoaderConst.DEF_LANG_FOLDER,
                                      TranslationLoaderConst.DEF_FILE_NAME)
 
+        logger = self.logger.GetLogger()
+
         if file_name is not None:
             try:
-                self.logger.GetLogger().info(f"Loading language file '{file_name}'...")
+                logger.info("Loading language file '%s'...", file_name)
                 self.__LoadFile(file_name)
             except FileNotFoundError:
-                self.logger.GetLogger().error(
-                    f"Language file '{file_name}' not found, loading default language..."
-                )
+                logger.error("Language file '%s' not found, loading default language...", file_name)
                 self.__LoadFile(def_file_path)
         else:
-            self.logger.GetLogger().info("Loading default language file...")
+            logger.info("Loading default language file...")
             self.__LoadFile(def_file_path)
 
     # Get sentence
     def GetSentence(self,
                     sentence_id: str,
                     **kwargs: Any) -> str:
-        return self.sentences[sentence_id].format(**kwargs)
+        if kwargs:
+            return self.__FormatSentence(self.sentences[sentence_id], kwargs)
+
+        # Sentences without parameters are formatted only the first time
+        if sentence_id not in self.no_param_sentences:
+            self.no_param_sentences[sentence_id] = self.__FormatSentence(self.sentences[sentence_id], {})
+        return self.no_param_sentences[sentence_id]
+
+    # Format sentence
+    @staticmethod
+    def __FormatSentence(sentence: str,
+                         params: Dict[str, Any]) -> str:
+        try:
+            return sentence.format_map(_SentenceParams(params))
+        # Malformed sentence (e.g. unbalanced or positional braces), replace named placeholders in a single pass
+        except (ValueError, IndexError):
+            return TranslationLoaderConst.PLACEHOLDER_REGEX.sub(
+                lambda match: str(params.get(match.group(1), match.group(0))),
+                sentence
+            )
 
     # Load file
     def __LoadFile(self,
                    file_name: str) -> None:
-        # Parse xml
-        tree = ElementTree.parse(file_name)
-        root = tree.getroot()
+        logger = self.logger.GetLogger()
+        # Checked once, since it cannot change while parsing
+        log_sentences = logger.isEnabledFor(logging.DEBUG)
+
+        # Parse xml incrementally
+        xml_events = ElementTree.iterparse(file_name, events=("end",))
+
+        # Sentences may be replaced, so invalidate the formatted ones
+        self.no_param_sentences.clear()
 
         # Load all sentences
-        for child in root:
-            if child.tag == TranslationLoaderConst.SENTENCE_XML_TAG and child.text is not None:
-                sentence_id = child.attrib["id"]
-                self.sentences[sentence_id] = child.text.replace("\\n", "\n")
-
-                self.logger.GetLogger().debug(
-                    f"Loaded sentence '{sentence_id}': {self.sentences[sentence_id]}"
-                )
-
-        self.logger.GetLogger().info(
-            f"Language file successfully loaded, number of sentences: {len(self.sentences)}"
-        )
+        for _, elem in xml_events:
+            if elem.tag == TranslationLoaderConst.SENTENCE_XML_TAG and elem.text is not None:
+                sentence_id = elem.attrib["id"]
+                self.sentences[sentence_id] = elem.text.replace("\\n", "\n")
+
+                if log_sentences:
+                    logger.debug("Loaded sentence '%s': %s", sentence_id, self.sentences[sentence_id])
+                # Free the parsed element, it's not needed anymore
+                elem.clear()
+
+        logger.info("Language file successfully loaded, number of sentences: %d", len(self.sentences))
@@ -35,6 +35,8 @@ from typing import Callable, Iterator, List, Optional, Union
 # Wrapped list class
 class WrappedList(ABC):
 
+    __slots__ = ("list_elements",)
+
     list_elements: List[typing.Any]
 
     # Constructor
@@ -50,9 +52,8 @@ class WrappedList(ABC):
     def AddMultiple(self,
                     elements: Union[List[typing.Any], WrappedList]) -> None:
         if isinstance(elements, WrappedList):
-            self.list_elements.extend(elements.GetList())
-        else:
-            self.list_elements.extend(elements)
+            elements = elements.GetList()
+        self.list_elements += elements
 
     # Remove single element
     def RemoveSingle(self,
@@ -62,7 +63,7 @@ class WrappedList(ABC):
     # Get if element is present
     def IsElem(self,
                element: typing.Any) -> bool:
-        return element in self.list_elements
+        return element in self
 
     # Clear element
     def Clear(self) -> None:
@@ -70,15 +71,15 @@ class WrappedList(ABC):
 
     # Get elements count
     def Count(self) -> int:
-        return len(self.list_elements)
+        return len(self)
 
     # Get if any
     def Any(self) -> bool:
-        return self.Count() > 0
+        return bool(self)
 
     # Get if empty
     def Empty(self) -> bool:
-        return self.Count() == 0
+        return not self
 
     # Sort
     def Sort(self,
@@ -109,3 +110,16 @@ class WrappedList(ABC):
     # Get iterator
     def __iter__(self) -> Iterator[typing.Any]:
         yield from self.list_elements
+
+    # Get if element is present
+    def __contains__(self,
+                     element: typing.Any) -> bool:
+        return element in self.list_elements
+
+    # Get elements count
+    def __len__(self) -> int:
+        return len(self.list_elements)
+
+    # Get if any
+    def __bool__(self) -> bool:
+        return bool(self.list_elements)